@@ -0,0 +1,35 @@
+#!/bin/bash
+# Validator Build Script
+# Compiles validate-devcontainers.py ahead of time with Nuitka so that
+# short-lived runs (e.g. pre-commit hooks) skip interpreter startup
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+SOURCE_FILE="$SCRIPT_DIR/validate-devcontainers.py"
+OUTPUT_DIR="$SCRIPT_DIR/bin"
+
+# Colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+CYAN='\033[0;36m'
+NC='\033[0m'
+
+# Check for Nuitka
+if ! python3 -m nuitka --version &> /dev/null; then
+    echo -e "${RED}Error: Nuitka is required but not installed${NC}"
+    echo "Install with: pip install nuitka"
+    exit 1
+fi
+
+echo -e "${CYAN}Compiling $SOURCE_FILE...${NC}"
+
+python3 -m nuitka \
+    --onefile \
+    --lto=yes \
+    --remove-output \
+    --output-dir="$OUTPUT_DIR" \
+    --output-filename=validate-devcontainers \
+    "$SOURCE_FILE"
+
+echo -e "${GREEN}Built $OUTPUT_DIR/validate-devcontainers${NC}"
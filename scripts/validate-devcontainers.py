@@ -2,15 +2,28 @@
 """
 Comprehensive DevContainer and Configuration Validation Script
 Validates configurations against framework intelligence patterns.
+
+Usage: validate-devcontainers.py [project_root]
+
+The project root defaults to the parent of this script's directory.
 """
 
 import json
 import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 
+# Prefer orjson for parsing when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Colors for terminal output
 class Colors:
     RED = '\033[0;31m'
@@ -20,72 +33,156 @@ class Colors:
     CYAN = '\033[0;36m'
     NC = '\033[0m'  # No Color
 
+
+class PlainColors(Colors):
+    """No-op palette used when stdout is not a terminal."""
+    RED = GREEN = YELLOW = BLUE = CYAN = NC = ''
+
+
+if not sys.stdout.isatty():
+    Colors = PlainColors
+
+
+class Severity(Enum):
+    """Severity of a validation finding."""
+    ERROR = "error"
+    WARNING = "warning"
+
+
+# A single validation finding
+Issue = Tuple[Severity, str]
+
+# Severity -> (output color, summary counter)
+SEVERITY_TABLE = {
+    Severity.ERROR: (Colors.RED, "errors"),
+    Severity.WARNING: (Colors.YELLOW, "warnings"),
+}
+
 # Required fields for DevContainer
 REQUIRED_DEVCONTAINER_FIELDS = ["name", "image"]
 
+# Expected types of known DevContainer fields: field -> (type, error message).
+# String fields must also be non-blank.
+DEVCONTAINER_FIELD_TYPES = {
+    "name": (str, "Field 'name' must be a non-empty string"),
+    "image": (str, "Field 'image' must be a non-empty string"),
+    "customizations": (dict, "Field 'customizations' must be a dictionary"),
+}
+
+# Length of the leading bytes of each deprecated pattern used as a prefilter
+ANCHOR_LENGTH = 16
+
+# Legacy (pre flat config) ESLint config filenames
+LEGACY_ESLINT_FILES = frozenset({'.eslintrc', '.eslintrc.js', '.eslintrc.json', '.eslintrc.yaml', '.eslintrc.yml'})
+
+# Tailwind config tokens, matched together in one pass over the file
+TAILWIND_TOKEN_RE = re.compile(r"(?P<exports>module\.exports)|(?P<theme>theme:)|(?P<purge>purge:)")
+
+# Directories never descended into when scanning for config files
+SKIP_DIRS = {"node_modules", ".git", "dist", "build", ".next"}
+
+# Config filenames, bucketed by named group
+CONFIG_FILE_RE = re.compile(
+    r"^(?:(?P<devcontainer>devcontainer\.json)"
+    r"|(?P<tailwind>tailwind\.config\.(?:js|ts|mjs))"
+    r"|(?P<eslint>\.eslintrc.*|eslint\.config\..*))$"
+)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson as a fast path when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (BOM, NaN/Infinity, integers
+            # beyond 64 bits); re-parse so results never depend on it
+            pass
+    return json.loads(text)
+
 
-def load_framework_intelligence(project_root: Path) -> Dict:
-    """Load framework intelligence from .framework-intelligence.json"""
+def load_framework_intelligence(project_root: Path) -> Tuple[Dict, Dict[str, Any]]:
+    """Load framework intelligence metadata and its compiled deprecated patterns."""
     intelligence_file = project_root / ".framework-intelligence.json"
 
     if not intelligence_file.exists():
         print(f"{Colors.YELLOW}Warning: Framework intelligence file not found at {intelligence_file}{Colors.NC}")
         print(f"{Colors.YELLOW}Run ./scripts/sync-framework-intelligence.sh to download{Colors.NC}")
-        return {}
+        return {}, compile_deprecated_patterns({})
 
     try:
-        with open(intelligence_file, 'r', encoding='utf-8') as f:
-            intelligence = json.load(f)
-            print(f"{Colors.GREEN}Loaded framework intelligence v{intelligence.get('version', 'unknown')}{Colors.NC}")
-            return intelligence
-    except json.JSONDecodeError as e:
+        with open(intelligence_file, 'rb') as f:
+            parsed = _loads(f.read().decode('utf-8'))
+        deprecated_patterns = compile_deprecated_patterns(parsed)
+        # The per-framework tree is only needed to build the patterns
+        intelligence = {key: value for key, value in parsed.items() if key != "intelligence"}
+
+        print(f"{Colors.GREEN}Loaded framework intelligence v{intelligence.get('version', 'unknown')}{Colors.NC}")
+        return intelligence, deprecated_patterns
+    except ValueError as e:
         print(f"{Colors.RED}Error: Invalid JSON in framework intelligence file: {e}{Colors.NC}")
-        return {}
+        return {}, compile_deprecated_patterns({})
     except Exception as e:
         print(f"{Colors.RED}Error loading framework intelligence: {e}{Colors.NC}")
-        return {}
+        return {}, compile_deprecated_patterns({})
 
 
-def validate_json_file(file_path: Path) -> Tuple[bool, str, Optional[Dict]]:
-    """Validate JSON syntax and return parsed content."""
+def validate_json_file(file_path: str) -> Tuple[bool, str, Optional[Dict], Optional[bytes]]:
+    """Validate JSON syntax and return parsed content along with the raw bytes."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = json.load(f)
-        return True, "", content
-    except json.JSONDecodeError as e:
-        return False, f"Invalid JSON: {e}", None
+        with open(file_path, 'rb') as f:
+            raw = f.read()
     except Exception as e:
-        return False, f"Error reading file: {e}", None
+        return False, f"Error reading file: {e}", None, None
 
+    # The deprecated-pattern scan matches UTF-8 bytes, so reject anything else
+    # here rather than letting the parser auto-detect UTF-16/32
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        return False, f"Error reading file: {e}", None, raw
 
-def check_deprecated_patterns(content: str, file_path: Path, intelligence: Dict) -> List[str]:
-    """Check content for deprecated patterns from framework intelligence."""
-    errors = []
+    try:
+        content = _loads(text)
+        return True, "", content, raw
+    except ValueError as e:
+        return False, f"Invalid JSON: {e}", None, raw
+    except Exception as e:
+        return False, f"Error reading file: {e}", None, raw
 
-    if not intelligence or "intelligence" not in intelligence:
-        return errors
 
-    # Flatten all deprecated patterns from all categories
+def compile_deprecated_patterns(intelligence: Dict) -> Dict[str, Any]:
+    """Flatten deprecated patterns and compile them into a single bytes regex."""
+    # Flatten all deprecated patterns from all categories, depth first with
+    # an explicit stack; children are pushed in reverse to keep file order
     all_deprecated = []
+    stack = []
+    if intelligence and "intelligence" in intelligence:
+        stack.append((intelligence.get("intelligence", {}), ""))
 
-    def extract_deprecated(data: Dict, category_path: str = ""):
-        if isinstance(data, dict):
-            if "deprecatedPatterns" in data:
-                for pattern_name, pattern_info in data["deprecatedPatterns"].items():
-                    if isinstance(pattern_info, dict):
-                        all_deprecated.append({
-                            "name": pattern_name,
-                            "category": category_path,
-                            **pattern_info
-                        })
-            for key, value in data.items():
-                if key != "deprecatedPatterns":
-                    new_path = f"{category_path}.{key}" if category_path else key
-                    extract_deprecated(value, new_path)
-
-    extract_deprecated(intelligence.get("intelligence", {}))
+    while stack:
+        data, category_path = stack.pop()
+        if not isinstance(data, dict):
+            continue
+
+        deprecated_patterns = data.get("deprecatedPatterns")
+        if deprecated_patterns:
+            for pattern_name, pattern_info in deprecated_patterns.items():
+                if isinstance(pattern_info, dict):
+                    all_deprecated.append({
+                        "name": pattern_name,
+                        "category": category_path,
+                        **pattern_info
+                    })
+
+        for key, value in reversed(data.items()):
+            if key != "deprecatedPatterns":
+                stack.append((value, f"{category_path}.{key}" if category_path else key))
+
+    entries = []
+    # UTF-8 search string -> [(entry index, variant rank)]
+    variants: Dict[bytes, List[Tuple[int, int]]] = {}
 
-    # Check content against deprecated patterns
     for deprecated in all_deprecated:
         pattern = deprecated.get("pattern", "")
         if not pattern:
@@ -99,99 +196,158 @@ def check_deprecated_patterns(content: str, file_path: Path, intelligence: Dict)
             search_patterns.append('"checkOnSave": true')
             search_patterns.append("'checkOnSave': true")
 
-        for search in search_patterns:
-            if search in content:
-                severity = deprecated.get("severity", "warning").upper()
-                replacement = deprecated.get("replacement", "See documentation")
-                reason = deprecated.get("reason", "")
+        for rank, search in enumerate(search_patterns):
+            variants.setdefault(search.encode('utf-8'), []).append((len(entries), rank))
+        entries.append((deprecated, search_patterns))
+
+    # Longest first, so each position reports its longest match; any shorter
+    # variant that also matches there is a prefix of it.
+    ordered = sorted(variants, key=len, reverse=True)
+    regex = anchors = None
+    if ordered:
+        regex = re.compile(b"(?=(" + b"|".join(re.escape(v) for v in ordered) + b"))")
+
+        # Every variant starts with one of these short anchors, so a file
+        # without any of them cannot contain a deprecated pattern
+        leading = sorted({v[:ANCHOR_LENGTH] for v in ordered}, key=len)
+        anchor_list = []
+        for prefix in leading:
+            # Drop anchors already covered by a shorter one
+            if not any(prefix.startswith(shorter) for shorter in anchor_list):
+                anchor_list.append(prefix)
+        anchors = re.compile(b"|".join(re.escape(a) for a in anchor_list))
+
+    prefixes = {
+        longer: [shorter for shorter in ordered if longer.startswith(shorter)]
+        for longer in ordered
+    }
+
+    return {
+        "entries": entries,
+        "variants": variants,
+        "prefixes": prefixes,
+        "regex": regex,
+        "anchors": anchors,
+    }
 
-                error_msg = f"[{severity}] Deprecated pattern found: {deprecated['name']}"
-                if reason:
-                    error_msg += f"\n    Reason: {reason}"
-                error_msg += f"\n    Found: {search[:80]}..."
-                error_msg += f"\n    Replace with: {replacement}"
 
-                errors.append(error_msg)
-                break
+def check_deprecated_patterns(content: bytes, file_path: str, compiled: Dict[str, Any]) -> List[Issue]:
+    """Check raw file content against deprecated patterns compiled from framework intelligence."""
+    errors = []
+
+    if compiled["regex"] is None:
+        return errors
+
+    # Cheap prefilter: most files contain no anchor at all
+    first_anchor = compiled["anchors"].search(content)
+    if first_anchor is None:
+        return errors
+
+    # entry index -> rank of the first matching variant
+    found: Dict[int, int] = {}
+    variants = compiled["variants"]
+    prefixes = compiled["prefixes"]
+    for match in compiled["regex"].finditer(content, first_anchor.start()):
+        for search in prefixes[match.group(1)]:
+            for index, rank in variants[search]:
+                if index not in found or rank < found[index]:
+                    found[index] = rank
+
+    # Check content against deprecated patterns
+    entries = compiled["entries"]
+    for index in sorted(found):
+        deprecated, search_patterns = entries[index]
+        search = search_patterns[found[index]]
+
+        if deprecated.get("severity", "warning").lower() == "warning":
+            severity = Severity.WARNING
+        else:
+            severity = Severity.ERROR
+        replacement = deprecated.get("replacement", "See documentation")
+        reason = deprecated.get("reason", "")
+
+        error_msg = f"Deprecated pattern found: {deprecated['name']}"
+        if reason:
+            error_msg += f"\n    Reason: {reason}"
+        error_msg += f"\n    Found: {search[:80]}..."
+        error_msg += f"\n    Replace with: {replacement}"
+
+        errors.append((severity, error_msg))
 
     return errors
 
 
-def validate_devcontainer_structure(config: Dict, file_path: Path, intelligence: Dict) -> List[str]:
+def validate_devcontainer_file(file_path: str, intelligence: Dict, deprecated_patterns: Dict[str, Any]) -> List[Issue]:
+    """Run all DevContainer checks for a single file."""
+    # Validate JSON syntax
+    is_valid, json_error, config, raw_content = validate_json_file(file_path)
+    if not is_valid:
+        return [(Severity.ERROR, f"Invalid JSON: {json_error}")]
+
+    # Validate structure
+    structure_errors = validate_devcontainer_structure(config, file_path, intelligence)
+
+    # Check for deprecated patterns in raw content
+    deprecated_errors = check_deprecated_patterns(raw_content, file_path, deprecated_patterns)
+
+    return structure_errors + deprecated_errors
+
+
+def validate_devcontainer_structure(config: Dict, file_path: str, intelligence: Dict) -> List[Issue]:
     """Validate DevContainer structure and required fields."""
-    errors = []
+    if not isinstance(config, dict):
+        return [(Severity.ERROR, "DevContainer config must be a JSON object")]
 
     # Check required fields
-    for field in REQUIRED_DEVCONTAINER_FIELDS:
-        if field not in config:
-            errors.append(f"Missing required field: '{field}'")
-
-    # Validate 'name' field
-    if "name" in config:
-        if not isinstance(config["name"], str) or not config["name"].strip():
-            errors.append("Field 'name' must be a non-empty string")
-
-    # Validate 'image' field
-    if "image" in config:
-        image = config["image"]
-        if not isinstance(image, str) or not image.strip():
-            errors.append("Field 'image' must be a non-empty string")
-        elif ":" not in image and "/" not in image:
-            errors.append(f"Field 'image' appears to be invalid Docker image format: {image}")
-
-    # Validate 'customizations' if present
-    if "customizations" in config:
-        customizations = config["customizations"]
-        if not isinstance(customizations, dict):
-            errors.append("Field 'customizations' must be a dictionary")
-        else:
-            # Validate VS Code settings
-            if "vscode" in customizations:
-                vscode_errors = validate_vscode_settings(
-                    customizations["vscode"],
-                    intelligence
-                )
-                errors.extend(vscode_errors)
+    errors = [
+        (Severity.ERROR, f"Missing required field: '{field}'")
+        for field in REQUIRED_DEVCONTAINER_FIELDS
+        if field not in config
+    ]
 
-    return errors
+    # Check field types in a single pass over the schema
+    for field, (expected_type, type_error) in DEVCONTAINER_FIELD_TYPES.items():
+        if field not in config:
+            continue
+        value = config[field]
 
+        if not isinstance(value, expected_type) or (expected_type is str and not value.strip()):
+            errors.append((Severity.ERROR, type_error))
+        elif field == "image" and ":" not in value and "/" not in value:
+            errors.append((Severity.ERROR, f"Field 'image' appears to be invalid Docker image format: {value}"))
 
-def validate_vscode_settings(vscode_config: Dict, intelligence: Dict) -> List[str]:
-    """Validate VS Code settings against framework intelligence."""
-    errors = []
+    # Validate VS Code settings; most configs have none, so bail out early
+    customizations = config.get("customizations")
+    if not isinstance(customizations, dict) or "vscode" not in customizations:
+        return errors
 
+    vscode_config = customizations["vscode"]
     if not isinstance(vscode_config, dict):
-        return ["vscode customization must be a dictionary"]
+        errors.append((Severity.ERROR, "vscode customization must be a dictionary"))
+        return errors
 
     settings = vscode_config.get("settings", {})
     if not isinstance(settings, dict):
-        return ["vscode.settings must be a dictionary"]
-
-    # Check rust-analyzer settings
-    if "rust-analyzer.checkOnSave" in settings:
-        check_on_save = settings["rust-analyzer.checkOnSave"]
-
-        # Boolean is deprecated
-        if isinstance(check_on_save, bool):
-            errors.append(
-                f"[ERROR] DEPRECATED: rust-analyzer.checkOnSave as boolean\n"
-                f"    Found: \"rust-analyzer.checkOnSave\": {str(check_on_save).lower()}\n"
-                f"    Replace with: \"rust-analyzer.checkOnSave\": {{ \"enable\": true, \"command\": \"clippy\" }}\n"
-                f"    Reason: Boolean syntax deprecated since 2023-06-01"
-            )
-
-    # Check for deprecated ESLint config references
-    extensions = vscode_config.get("extensions", [])
-    if isinstance(extensions, list):
-        # Check if using eslint but might have old config
-        if "dbaeumer.vscode-eslint" in extensions:
-            # This is fine, just a note that flat config should be used
-            pass
+        errors.append((Severity.ERROR, "vscode.settings must be a dictionary"))
+        return errors
+    if not settings:
+        return errors
+
+    # Check rust-analyzer settings: boolean checkOnSave is deprecated
+    check_on_save = settings.get("rust-analyzer.checkOnSave")
+    if isinstance(check_on_save, bool):
+        errors.append((
+            Severity.ERROR,
+            f"DEPRECATED: rust-analyzer.checkOnSave as boolean\n"
+            f"    Found: \"rust-analyzer.checkOnSave\": {str(check_on_save).lower()}\n"
+            f"    Replace with: \"rust-analyzer.checkOnSave\": {{ \"enable\": true, \"command\": \"clippy\" }}\n"
+            f"    Reason: Boolean syntax deprecated since 2023-06-01"
+        ))
 
     return errors
 
 
-def validate_tailwind_config(config_path: Path, intelligence: Dict) -> List[str]:
+def validate_tailwind_config(config_path: str, intelligence: Dict) -> List[Issue]:
     """Validate Tailwind CSS configuration."""
     errors = []
 
@@ -199,46 +355,72 @@ def validate_tailwind_config(config_path: Path, intelligence: Dict) -> List[str]
         with open(config_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
+        # Collect all tokens of interest in a single scan
+        found = set()
+        for match in TAILWIND_TOKEN_RE.finditer(content):
+            found.add(match.lastgroup)
+            if len(found) == TAILWIND_TOKEN_RE.groups:
+                break
+
         # Check for Tailwind 3 patterns in Tailwind 4 world
-        if "module.exports" in content and "theme:" in content:
-            errors.append(
-                f"[WARNING] Tailwind 3 configuration detected\n"
+        if "exports" in found and "theme" in found:
+            errors.append((
+                Severity.WARNING,
+                f"Tailwind 3 configuration detected\n"
                 f"    Consider migrating to Tailwind 4 CSS-first config\n"
                 f"    Use @theme {{ }} directive in CSS instead of JS config"
-            )
+            ))
 
-        if "purge:" in content:
-            errors.append(
-                f"[ERROR] Deprecated 'purge' option found\n"
+        if "purge" in found:
+            errors.append((
+                Severity.ERROR,
+                f"Deprecated 'purge' option found\n"
                 f"    Replace with: content: ['./src/**/*.{{js,jsx,ts,tsx}}']"
-            )
+            ))
 
     except Exception as e:
-        errors.append(f"Error reading Tailwind config: {e}")
+        errors.append((Severity.WARNING, f"Error reading Tailwind config: {e}"))
 
     return errors
 
 
-def validate_eslint_config(config_path: Path, intelligence: Dict) -> List[str]:
+def validate_eslint_config(config_path: str, intelligence: Dict) -> List[Issue]:
     """Validate ESLint configuration."""
     errors = []
 
-    filename = config_path.name
+    filename = os.path.basename(config_path)
 
     # Check for legacy config files
-    legacy_files = ['.eslintrc', '.eslintrc.js', '.eslintrc.json', '.eslintrc.yaml', '.eslintrc.yml']
-    if filename in legacy_files:
-        errors.append(
-            f"[WARNING] Legacy ESLint config format detected: {filename}\n"
+    if filename in LEGACY_ESLINT_FILES:
+        errors.append((
+            Severity.WARNING,
+            f"Legacy ESLint config format detected: {filename}\n"
             f"    ESLint 9+ uses flat config format\n"
             f"    Migrate to: eslint.config.js or eslint.config.mjs"
-        )
+        ))
 
     return errors
 
 
-def find_config_files(root_dir: Path) -> Dict[str, List[Path]]:
-    """Find all configuration files to validate."""
+def _walk(root: str):
+    """Yield (directory, filename) for every file under root, pruning SKIP_DIRS."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield directory, entry.name
+        except OSError:
+            continue
+
+
+def find_config_files(root_dir: str) -> Dict[str, List[str]]:
+    """Find all configuration files to validate in a single pass over the tree."""
     configs = {
         "devcontainer": [],
         "tailwind": [],
@@ -247,163 +429,165 @@ def find_config_files(root_dir: Path) -> Dict[str, List[Path]]:
         "tsconfig": []
     }
 
-    # DevContainer files
-    patterns = [
-        root_dir.rglob(".devcontainer/devcontainer.json"),
-        root_dir.rglob("**/devcontainer.json"),
-        root_dir.rglob("tools/devcontainer/*.json"),
-    ]
-    for pattern in patterns:
-        for file in pattern:
-            if "node_modules" not in str(file):
-                configs["devcontainer"].append(file)
-
-    # Tailwind config
-    for pattern in ["tailwind.config.js", "tailwind.config.ts", "tailwind.config.mjs"]:
-        for file in root_dir.rglob(pattern):
-            if "node_modules" not in str(file):
-                configs["tailwind"].append(file)
-
-    # ESLint config
-    eslint_patterns = [".eslintrc*", "eslint.config.*"]
-    for pattern in eslint_patterns:
-        for file in root_dir.glob(pattern):
-            configs["eslint"].append(file)
-
-    # Remove duplicates
-    for key in configs:
-        configs[key] = sorted(set(configs[key]))
+    tools_suffix = os.sep + os.path.join("tools", "devcontainer")
+
+    for directory, filename in _walk(root_dir):
+        match = CONFIG_FILE_RE.match(filename)
+        # ESLint configs are only picked up at the project root; elsewhere an
+        # ESLint-named file may still be a tools/devcontainer/*.json config
+        if match and (match.lastgroup != "eslint" or directory == root_dir):
+            configs[match.lastgroup].append(os.path.join(directory, filename))
+        elif filename.endswith(".json") and directory.endswith(tools_suffix):
+            configs["devcontainer"].append(os.path.join(directory, filename))
+
+    # The walk visits each file once and files land in a single bucket,
+    # so sorting is enough; sort by path component to match Path ordering
+    for files in configs.values():
+        files.sort(key=lambda p: p.split(os.sep))
 
     return configs
 
 
+def flush_output(lines: List[str]) -> None:
+    """Write buffered output lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
+
+
 def main():
     """Main validation function."""
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    if len(sys.argv) > 1:
+        project_root = Path(sys.argv[1])
+        if not project_root.is_dir():
+            print(f"{Colors.RED}Error: Project root is not a directory: {project_root}{Colors.NC}")
+            sys.exit(1)
+    else:
+        project_root = Path(__file__).parent.parent
 
     print(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
     print(f"{Colors.BLUE}  Framework Intelligence Configuration Validator{Colors.NC}")
     print(f"{Colors.BLUE}{'=' * 60}{Colors.NC}\n")
 
     # Load framework intelligence
-    intelligence = load_framework_intelligence(project_root)
+    intelligence, deprecated_patterns = load_framework_intelligence(project_root)
 
     print(f"\n{Colors.CYAN}Scanning: {project_root}{Colors.NC}\n")
 
     # Find all config files
-    config_files = find_config_files(project_root)
+    config_files = find_config_files(str(project_root))
+
+    # Per-file output is buffered and written once per section
+    out: List[str] = []
+    emit = out.append
+
+    # Files are validated independently, so run them concurrently and
+    # report the results in discovery order afterwards
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        devcontainer_results = executor.map(
+            validate_devcontainer_file,
+            config_files["devcontainer"],
+            repeat(intelligence),
+            repeat(deprecated_patterns),
+        )
+        tailwind_results = executor.map(
+            validate_tailwind_config,
+            config_files["tailwind"],
+            repeat(intelligence),
+        )
 
-    total_errors = 0
-    total_warnings = 0
+    counters = {"errors": 0, "warnings": 0}
     total_validated = 0
 
     # Validate DevContainers
     if config_files["devcontainer"]:
-        print(f"\n{Colors.CYAN}DevContainer Files ({len(config_files['devcontainer'])}){Colors.NC}")
-        print("-" * 40)
+        emit(f"\n{Colors.CYAN}DevContainer Files ({len(config_files['devcontainer'])}){Colors.NC}")
+        emit("-" * 40)
 
-        for devcontainer_file in config_files["devcontainer"]:
+        for devcontainer_file, all_errors in zip(config_files["devcontainer"], devcontainer_results):
             try:
-                rel_path = devcontainer_file.relative_to(project_root)
+                rel_path = os.path.relpath(devcontainer_file, project_root)
             except ValueError:
                 rel_path = devcontainer_file
 
-            print(f"\n{Colors.BLUE}{rel_path}{Colors.NC}")
-
-            # Validate JSON syntax
-            is_valid, json_error, config = validate_json_file(devcontainer_file)
-            if not is_valid:
-                print(f"  {Colors.RED}Invalid JSON: {json_error}{Colors.NC}")
-                total_errors += 1
-                continue
-
-            # Validate structure
-            structure_errors = validate_devcontainer_structure(config, devcontainer_file, intelligence)
-
-            # Check for deprecated patterns in raw content
-            with open(devcontainer_file, 'r', encoding='utf-8') as f:
-                raw_content = f.read()
-            deprecated_errors = check_deprecated_patterns(raw_content, devcontainer_file, intelligence)
-
-            all_errors = structure_errors + deprecated_errors
+            emit(f"\n{Colors.BLUE}{rel_path}{Colors.NC}")
 
             if all_errors:
-                for error in all_errors:
-                    if "[ERROR]" in error:
-                        print(f"  {Colors.RED}{error}{Colors.NC}")
-                        total_errors += 1
-                    elif "[WARNING]" in error:
-                        print(f"  {Colors.YELLOW}{error}{Colors.NC}")
-                        total_warnings += 1
-                    else:
-                        print(f"  {Colors.RED}{error}{Colors.NC}")
-                        total_errors += 1
+                for severity, message in all_errors:
+                    color, counter = SEVERITY_TABLE[severity]
+                    emit(f"  {color}[{severity.name}] {message}{Colors.NC}")
+                    counters[counter] += 1
             else:
-                print(f"  {Colors.GREEN}Valid{Colors.NC}")
+                emit(f"  {Colors.GREEN}Valid{Colors.NC}")
                 total_validated += 1
 
+        flush_output(out)
+
     # Validate Tailwind configs
     if config_files["tailwind"]:
-        print(f"\n{Colors.CYAN}Tailwind CSS Configs ({len(config_files['tailwind'])}){Colors.NC}")
-        print("-" * 40)
+        emit(f"\n{Colors.CYAN}Tailwind CSS Configs ({len(config_files['tailwind'])}){Colors.NC}")
+        emit("-" * 40)
 
-        for tailwind_file in config_files["tailwind"]:
+        for tailwind_file, errors in zip(config_files["tailwind"], tailwind_results):
             try:
-                rel_path = tailwind_file.relative_to(project_root)
+                rel_path = os.path.relpath(tailwind_file, project_root)
             except ValueError:
                 rel_path = tailwind_file
 
-            print(f"\n{Colors.BLUE}{rel_path}{Colors.NC}")
+            emit(f"\n{Colors.BLUE}{rel_path}{Colors.NC}")
 
-            errors = validate_tailwind_config(tailwind_file, intelligence)
             if errors:
-                for error in errors:
-                    if "[ERROR]" in error:
-                        print(f"  {Colors.RED}{error}{Colors.NC}")
-                        total_errors += 1
-                    else:
-                        print(f"  {Colors.YELLOW}{error}{Colors.NC}")
-                        total_warnings += 1
+                for severity, message in errors:
+                    color, counter = SEVERITY_TABLE[severity]
+                    emit(f"  {color}[{severity.name}] {message}{Colors.NC}")
+                    counters[counter] += 1
             else:
-                print(f"  {Colors.GREEN}Valid{Colors.NC}")
+                emit(f"  {Colors.GREEN}Valid{Colors.NC}")
                 total_validated += 1
 
+        flush_output(out)
+
     # Validate ESLint configs
     if config_files["eslint"]:
-        print(f"\n{Colors.CYAN}ESLint Configs ({len(config_files['eslint'])}){Colors.NC}")
-        print("-" * 40)
+        emit(f"\n{Colors.CYAN}ESLint Configs ({len(config_files['eslint'])}){Colors.NC}")
+        emit("-" * 40)
 
         for eslint_file in config_files["eslint"]:
-            print(f"\n{Colors.BLUE}{eslint_file.name}{Colors.NC}")
+            emit(f"\n{Colors.BLUE}{os.path.basename(eslint_file)}{Colors.NC}")
 
             errors = validate_eslint_config(eslint_file, intelligence)
             if errors:
-                for error in errors:
-                    if "[ERROR]" in error:
-                        print(f"  {Colors.RED}{error}{Colors.NC}")
-                        total_errors += 1
-                    else:
-                        print(f"  {Colors.YELLOW}{error}{Colors.NC}")
-                        total_warnings += 1
+                for severity, message in errors:
+                    color, counter = SEVERITY_TABLE[severity]
+                    emit(f"  {color}[{severity.name}] {message}{Colors.NC}")
+                    counters[counter] += 1
             else:
-                print(f"  {Colors.GREEN}Valid{Colors.NC}")
+                emit(f"  {Colors.GREEN}Valid{Colors.NC}")
                 total_validated += 1
 
+        flush_output(out)
+
+    total_errors = counters["errors"]
+    total_warnings = counters["warnings"]
+
     # Summary
-    print(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
-    print(f"{Colors.BLUE}  Validation Summary{Colors.NC}")
-    print(f"{Colors.BLUE}{'=' * 60}{Colors.NC}")
-    print(f"  {Colors.GREEN}Valid:{Colors.NC} {total_validated}")
-    print(f"  {Colors.YELLOW}Warnings:{Colors.NC} {total_warnings}")
-    print(f"  {Colors.RED}Errors:{Colors.NC} {total_errors}")
-    print()
+    emit(f"\n{Colors.BLUE}{'=' * 60}{Colors.NC}")
+    emit(f"{Colors.BLUE}  Validation Summary{Colors.NC}")
+    emit(f"{Colors.BLUE}{'=' * 60}{Colors.NC}")
+    emit(f"  {Colors.GREEN}Valid:{Colors.NC} {total_validated}")
+    emit(f"  {Colors.YELLOW}Warnings:{Colors.NC} {total_warnings}")
+    emit(f"  {Colors.RED}Errors:{Colors.NC} {total_errors}")
+    emit("")
 
     if total_errors == 0:
-        print(f"{Colors.GREEN}All configurations are valid!{Colors.NC}\n")
+        emit(f"{Colors.GREEN}All configurations are valid!{Colors.NC}\n")
+        flush_output(out)
         sys.exit(0)
     else:
-        print(f"{Colors.RED}{total_errors} error(s) found. Please fix before committing.{Colors.NC}\n")
+        emit(f"{Colors.RED}{total_errors} error(s) found. Please fix before committing.{Colors.NC}\n")
+        flush_output(out)
         sys.exit(1)
 
 
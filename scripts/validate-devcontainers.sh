@@ -0,0 +1,18 @@
+#!/bin/bash
+# Configuration Validator Launcher
+# Runs the compiled validator from scripts/bin when it is present and
+# newer than the Python source, otherwise falls back to the Python script.
+# Arguments are passed through; the project root defaults to the repo root
+
+set -e
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+SOURCE_FILE="$SCRIPT_DIR/validate-devcontainers.py"
+BINARY="$SCRIPT_DIR/bin/validate-devcontainers"
+
+if [[ -x "$BINARY" && "$BINARY" -nt "$SOURCE_FILE" ]]; then
+    exec "$BINARY" "${@:-$PROJECT_ROOT}"
+fi
+
+exec python3 "$SOURCE_FILE" "${@:-$PROJECT_ROOT}"